@@ -2,7 +2,7 @@ import re
 from datetime import datetime, timedelta, time, date
 from typing import List, Tuple
 
-from pytz import timezone
+from zoneinfo import ZoneInfo
 
 from config import *
 from errors import *
@@ -13,7 +13,7 @@ def tz_aware_now() -> datetime:
     Return current time in Warsaw timezone.
     :return: datetime object with timezone info
     """
-    return datetime.now(timezone("Europe/Warsaw"))
+    return datetime.now(ZoneInfo("Europe/Warsaw"))
 
 
 def construct_date(text: str, dmy: bool) -> date:
@@ -1,14 +1,32 @@
 from datetime import datetime, date
+from functools import cache
 from pathlib import Path
 from typing import List
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlmodel import text
+from sqlalchemy import text, TextClause
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 
 from config import DATABASE
 from models import FamilyRow, SMSRow, EmailsRow
 
-engine = create_async_engine(DATABASE, echo=False, pool_pre_ping=True)
+
+@cache
+def get_engine() -> AsyncEngine:
+    """
+    Return the shared asynchronous engine, creating it on first use.
+    No connection is opened until the first query.
+    """
+    return create_async_engine(DATABASE, echo=False, pool_pre_ping=True)
+
+
+@cache
+def load_sql(name: str) -> TextClause:
+    """
+    Read a query from the sql directory once and keep the compiled clause.
+    :param name: File name without the .sql extension
+    :return: SQLAlchemy TextClause ready to be executed
+    """
+    return text(Path(f'sql/{name}.sql').read_text().strip())
 
 
 async def get_family_data(tel: str, session: AsyncSession) -> List[FamilyRow]:
@@ -19,8 +37,7 @@ async def get_family_data(tel: str, session: AsyncSession) -> List[FamilyRow]:
     :return: List of FamilyRow objects containing children data and bus
         line used by the child. The same child may appear in many rows.
     """
-    sql = Path('sql/family.sql').read_text().strip()
-    result = await session.execute(text(sql), {'tel': tel})
+    result = await session.execute(load_sql('family'), {'tel': tel})
     return [FamilyRow(*row) for row in result.fetchall()]
 
 
@@ -43,9 +60,8 @@ async def insert_sms_record(
     :param child_id: Child ID
     :param line_id: Bus line ID
     """
-    sql = Path("sql/sms.sql").read_text().strip()
     await session.execute(
-        text(sql),
+        load_sql('sms'),
         {
             "dateReceived": datetime.now(),
             "dateReceivedAPI": datetime.fromtimestamp(int(date_received_api)),
@@ -65,8 +81,7 @@ async def get_todays_sms(session: AsyncSession) -> List[SMSRow]:
     :param session: SQLAlchemy asynchronous session object
     :return: List of SMSSow objects containing today's SMS data.
     """
-    sql = Path('sql/today.sql').read_text().strip()
-    result = await session.execute(text(sql))
+    result = await session.execute(load_sql('today'))
     return [SMSRow(*row) for row in result.fetchall()]
 
 
@@ -76,6 +91,5 @@ async def get_emails(session: AsyncSession) -> List[EmailsRow]:
     :param session: SQLAlchemy asynchronous session object
     :return: List of EmailsRow objects
     """
-    sql = Path('sql/emails.sql').read_text().strip()
-    result = await session.execute(text(sql))
+    result = await session.execute(load_sql('emails'))
     return [EmailsRow(*row) for row in result.fetchall()]
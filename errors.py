@@ -1,4 +1,4 @@
-from pytz import timezone
+from zoneinfo import ZoneInfo
 
 from config import FUTURE_LIMIT, MAX_RANGE
 from datetime import datetime
@@ -35,7 +35,7 @@ class TooManyDatesError(SMSValidationError):
 class DateInPastError(SMSValidationError):
     # override constructor to calculate current date when raised
     def __init__(self, param: str):
-        today = datetime.now(timezone("Europe/Warsaw")).strftime('%d.%m.%Y')
+        today = datetime.now(ZoneInfo("Europe/Warsaw")).strftime('%d.%m.%Y')
         self.message_template = "Data {} jest w przeszłości. Dzisiaj jest " + today + "."
         super().__init__(param)
 
@@ -6,17 +6,20 @@ from datetime import datetime
 from jinja2 import Environment, FileSystemLoader
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from db import engine, get_emails, get_todays_sms
+from db import get_engine, get_emails, get_todays_sms
 from utils import group_list_by_key, current_local_time_string
 from config import EMAIL, EMAIL_PASSWORD, SMTP_HOST, SMTP_PORT
 
-templates = Environment(loader=FileSystemLoader('templates'))
 
 async def main() -> None:
     """
     Send email report of today's SMS messages for each bus line.
+    Only the database layer and Jinja are needed, the web stack is never imported.
     :return: None
     """
+    template = Environment(loader=FileSystemLoader('templates')).get_template('email.jinja')
+    engine = get_engine()
+
     async with AsyncSession(engine) as session:
         email_rows = await get_emails(session)
         sms_rows = await get_todays_sms(session)
@@ -35,7 +38,7 @@ async def main() -> None:
                 continue
 
             sms_list = grouped_sms_rows.get(line_code)
-            html_body = templates.get_template('email.jinja').render(messages=sms_list)
+            html_body = template.render(messages=sms_list)
 
             msg = EmailMessage()
             msg["From"] = EMAIL
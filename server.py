@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from typing import Annotated
 
 from fastapi import FastAPI, Depends
@@ -6,13 +7,32 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import PlainTextResponse
 
-from db import get_todays_sms, engine
-from models import NewSMSRequestBody
-from sms import process_sms_wrapper
-from utils import get_client_ip, get_whitelisted_ips, get_current_username, parse_request_body_utf8
+from db import get_todays_sms, get_engine, load_sql
+from sms import process_sms_wrapper, close_sms_client
+from web import get_client_ip, get_whitelisted_ips, get_current_username, parse_request_body_utf8
 
-app = FastAPI()
-templates = Jinja2Templates(directory="templates")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build templates, queries and the engine once the server starts instead
+    of at import time, and release pooled connections on shutdown.
+    """
+    templates = Jinja2Templates(directory="templates")
+    # Compile templates and queries up front so the first request doesn't pay for it.
+    templates.get_template("admin.jinja")
+    for name in ("family", "sms", "today"):
+        load_sql(name)
+    app.state.templates = templates
+    get_engine()
+
+    yield
+
+    await close_sms_client()
+    await get_engine().dispose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.post("/sms")
@@ -26,8 +46,8 @@ async def new_sms(request: Request, background_tasks: BackgroundTasks):
 
 @app.get("/admin")
 async def admin(request: Request, _: Annotated[str, Depends(get_current_username)]):
-    async with AsyncSession(engine) as session:
-        return templates.TemplateResponse("admin.jinja", {
+    async with AsyncSession(get_engine()) as session:
+        return request.app.state.templates.TemplateResponse("admin.jinja", {
             'request': request,
             "rows": await get_todays_sms(session)})
 
@@ -1,29 +1,57 @@
 import logging
+from typing import TYPE_CHECKING, Optional
 
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import SMSAPI
 from dates import *
-from db import get_family_data, engine, insert_sms_record
+from db import get_family_data, get_engine, insert_sms_record
 from errors import *
 from models import NewSMSRequestBody
 from utils import name_in_text, create_confirmation_message
 
+if TYPE_CHECKING:
+    import httpx
+
 sms_logger = logging.getLogger('sms')
 
+_sms_client: Optional["httpx.AsyncClient"] = None
+
 
-async def send_sms_async(to: str, message: str) -> httpx.Response:
-    async with httpx.AsyncClient() as client:
-        return await client.post(
-            "https://api.smsapi.pl/sms.do",
+def get_sms_client() -> "httpx.AsyncClient":
+    """
+    Return the shared SMSAPI client, importing httpx and creating the
+    client on first use. Connections are reused between messages.
+    """
+    global _sms_client
+    if _sms_client is None or _sms_client.is_closed:
+        import httpx
+        _sms_client = httpx.AsyncClient(
+            base_url="https://api.smsapi.pl",
             headers={"Authorization": f"Bearer {SMSAPI}"},
-            params={
-                "to": to,
-                "message": message,
-                "encoding": "utf-8",
-            }
         )
+    return _sms_client
+
+
+async def close_sms_client() -> None:
+    """
+    Close the shared SMSAPI client if it was ever created.
+    """
+    global _sms_client
+    if _sms_client is not None:
+        await _sms_client.aclose()
+        _sms_client = None
+
+
+async def send_sms_async(to: str, message: str) -> "httpx.Response":
+    return await get_sms_client().post(
+        "/sms.do",
+        params={
+            "to": to,
+            "message": message,
+            "encoding": "utf-8",
+        }
+    )
 
 
 async def process_sms(body: NewSMSRequestBody, session: AsyncSession) -> None:
@@ -87,7 +115,7 @@ async def process_sms_wrapper(body: NewSMSRequestBody) -> None:
     Call process_sms with an asynchronous database session. Handle
     internal errors and log results.
     """
-    async with AsyncSession(engine) as session:
+    async with AsyncSession(get_engine()) as session:
         try:
             await process_sms(body, session)
         except SMSValidationError as e:
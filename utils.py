@@ -1,43 +1,19 @@
-import json
 import re
-import secrets
 from datetime import date, datetime
-from typing import Set, Annotated, List, Tuple, Iterable, Callable
+from typing import List, Tuple, Iterable, Callable
 from collections import defaultdict
 from zoneinfo import ZoneInfo
 
-from fastapi import Request, Depends, status, HTTPException
-from fastapi.security import HTTPBasicCredentials, HTTPBasic
-from unidecode import unidecode
-
-from config import ADMIN_USERNAME, ADMIN_PASSWORD, CONFIRMATION_FORMAT
-from models import FamilyRow, NewSMSRequestBody
-
-
-def get_client_ip(request: Request) -> str:
-    """
-    Return the original client IP, using 'X-Forwarded-For' if behind a proxy.
-    """
-    xff = request.headers.get("x-forwarded-for")
-    if xff:
-        return xff.split(",")[0].strip()
-    return request.client.host
-
-
-def get_whitelisted_ips(filename='whitelist.json') -> Set[str]:
-    """
-    Return trusted IP addresses stored in the specified JSON file.
-    :param filename: Relative path to JSON file
-    :return: Set of IP addresses
-    """
-    with open(filename) as f:
-        return set(json.load(f))
+from config import CONFIRMATION_FORMAT
+from models import FamilyRow
 
 
 def normalize(text: str) -> str:
     """
     Return ASCII-only, lowercase version of given text.
     """
+    # Imported here so that processes which never match names don't pay for it.
+    from unidecode import unidecode
     return unidecode(text).lower()
 
 
@@ -49,24 +25,6 @@ def name_in_text(name: str, text: str) -> bool:
     return re.search(pattern, normalize(text)) is not None
 
 
-def get_current_username(credentials: Annotated[HTTPBasicCredentials, Depends(HTTPBasic())]) -> str:
-    """
-    Validate user credentials using HTTP Basic Authentication.
-    :param credentials: HTTPBasicCredentials object containing username and password
-    :return: Username if credentials are correct
-    :raises: HTTPException (401) if credentials are invalid, with WWW-Authenticate header
-    """
-    is_correct_username = secrets.compare_digest(credentials.username, ADMIN_USERNAME)
-    is_correct_password = secrets.compare_digest(credentials.password, ADMIN_PASSWORD)
-    if not (is_correct_username and is_correct_password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Basic"},
-        )
-    return credentials.username
-
-
 def create_confirmation_message(family_matched: List[FamilyRow], dates: List[Tuple[str, date]]) -> str:
     """
     Create a confirmation message for SMS sender.
@@ -82,16 +40,6 @@ def create_confirmation_message(family_matched: List[FamilyRow], dates: List[Tup
     return CONFIRMATION_FORMAT.format(', '.join(children_full_names), dates_str)
 
 
-async def parse_request_body_utf8(request: Request) -> NewSMSRequestBody:
-    """
-    Parse the request body as UTF-8 encoded text.
-    :param request: FastAPI Request object
-    :return: NewSMSRequestBody object containing parsed data
-    """
-    form = await request.form()
-    return NewSMSRequestBody(**form)
-
-
 def group_list_by_key(items: Iterable, key_func: Callable) -> defaultdict:
     """
     Group a list of items by a key.
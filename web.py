@@ -0,0 +1,57 @@
+import json
+import secrets
+from typing import Set, Annotated
+
+from fastapi import Request, Depends, status, HTTPException
+from fastapi.security import HTTPBasicCredentials, HTTPBasic
+
+from config import ADMIN_USERNAME, ADMIN_PASSWORD
+from models import NewSMSRequestBody
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Return the original client IP, using 'X-Forwarded-For' if behind a proxy.
+    """
+    xff = request.headers.get("x-forwarded-for")
+    if xff:
+        return xff.split(",")[0].strip()
+    return request.client.host
+
+
+def get_whitelisted_ips(filename='whitelist.json') -> Set[str]:
+    """
+    Return trusted IP addresses stored in the specified JSON file.
+    :param filename: Relative path to JSON file
+    :return: Set of IP addresses
+    """
+    with open(filename) as f:
+        return set(json.load(f))
+
+
+def get_current_username(credentials: Annotated[HTTPBasicCredentials, Depends(HTTPBasic())]) -> str:
+    """
+    Validate user credentials using HTTP Basic Authentication.
+    :param credentials: HTTPBasicCredentials object containing username and password
+    :return: Username if credentials are correct
+    :raises: HTTPException (401) if credentials are invalid, with WWW-Authenticate header
+    """
+    is_correct_username = secrets.compare_digest(credentials.username, ADMIN_USERNAME)
+    is_correct_password = secrets.compare_digest(credentials.password, ADMIN_PASSWORD)
+    if not (is_correct_username and is_correct_password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Basic"},
+        )
+    return credentials.username
+
+
+async def parse_request_body_utf8(request: Request) -> NewSMSRequestBody:
+    """
+    Parse the request body as UTF-8 encoded text.
+    :param request: FastAPI Request object
+    :return: NewSMSRequestBody object containing parsed data
+    """
+    form = await request.form()
+    return NewSMSRequestBody(**form)